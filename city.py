@@ -1,8 +1,14 @@
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from types import MappingProxyType
+from typing import Mapping, Union
 
 
-@dataclass
+# Для супісків, дрібних та пилуватих пісків глибина промерзання збільшується на 20%
+SANDY_SOIL_FREEZING_FACTOR = 1.2
+
+
+@dataclass(frozen=True, slots=True)
 class City:
     """
     Зберігає кліматичні параметри для конкретного міста.
@@ -11,10 +17,111 @@ class City:
         name (str): Назва міста
         soil_freezing_depth__Z_H_max (float): Глибина промерзання ґрунту
         climate_index__a_0 (float): Кліматичний показник α0
+
+    Attributes:
+        soil_freezing_depth_sandy__Z_H_max (float): Глибина промерзання для супісків,
+            дрібних та пилуватих пісків (обчислюється автоматично)
     """
     name: str
     soil_freezing_depth__Z_H_max: float
     climate_index__a_0: float
+    soil_freezing_depth_sandy__Z_H_max: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            'soil_freezing_depth_sandy__Z_H_max',
+            self.soil_freezing_depth__Z_H_max * SANDY_SOIL_FREEZING_FACTOR,
+        )
+
+
+class CityKey(Enum):
+    """
+    Ідентифікатори міст з таблиці кліматичних параметрів.
+
+    """
+    KYIV = auto()
+    KHARKIV = auto()
+    LVIV = auto()
+    ODESA = auto()
+    DNIPRO = auto()
+    DONETSK = auto()
+    LUTSK = auto()
+    UZHHOROD = auto()
+    CHERNIHIV = auto()
+    SUMY = auto()
+    POLTAVA = auto()
+    CHERKASY = auto()
+    VINNYTSIA = auto()
+    ZHYTOMYR = auto()
+    KHMELNYTSKYI = auto()
+    TERNOPIL = auto()
+    RIVNE = auto()
+    IVANO_FRANKIVSK = auto()
+    CHERNIVTSI = auto()
+    MYKOLAIV = auto()
+    KHERSON = auto()
+    ZAPORIZHZHIA = auto()
+    KROPYVNYTSKYI = auto()
+    LUHANSK = auto()
+    SIMFEROPOL = auto()
+
+
+# Source: ГБН В.2.3-37641918-559:2019, рисунок 7.2
+# (ключ, назва, глибина промерзання Z_H_max, кліматичний показник α0)
+_CITY_ROWS = (
+    (CityKey.KYIV,            'Київ',             0.95, 0.65),
+    (CityKey.KHARKIV,         'Харків',           1.00, 0.95),
+    (CityKey.LVIV,            'Львів',            0.85, 0.70),
+    (CityKey.ODESA,           'Одеса',            0.65, 0.70),
+    (CityKey.DNIPRO,          'Дніпро',           0.85, 0.85),
+    (CityKey.DONETSK,         'Донецьк',          0.90, 0.90),
+    (CityKey.LUTSK,           'Луцьк',            0.80, 0.60),
+    (CityKey.UZHHOROD,        'Ужгород',          0.65, 0.55),
+    (CityKey.CHERNIHIV,       'Чернігів',         1.10, 0.90),
+    (CityKey.SUMY,            'Суми',             1.05, 1.00),
+    (CityKey.POLTAVA,         'Полтава',          0.95, 0.90),
+    (CityKey.CHERKASY,        'Черкаси',          0.90, 0.80),
+    (CityKey.VINNYTSIA,       'Вінниця',          0.85, 0.50),
+    (CityKey.ZHYTOMYR,        'Житомир',          0.90, 0.55),
+    (CityKey.KHMELNYTSKYI,    'Хмельницький',     0.85, 0.50),
+    (CityKey.TERNOPIL,        'Тернопіль',        0.85, 0.55),
+    (CityKey.RIVNE,           'Рівне',            0.85, 0.60),
+    (CityKey.IVANO_FRANKIVSK, 'Івано-Франківськ', 0.90, 0.70),
+    (CityKey.CHERNIVTSI,      'Чернівці',         0.75, 0.60),
+    (CityKey.MYKOLAIV,        'Миколаїв',         0.70, 0.75),
+    (CityKey.KHERSON,         'Херсон',           0.70, 0.70),
+    (CityKey.ZAPORIZHZHIA,    'Запоріжжя',        0.80, 0.85),
+    (CityKey.KROPYVNYTSKYI,   'Кропивницький',    0.85, 0.85),
+    (CityKey.LUHANSK,         'Луганськ',         1.00, 0.95),
+    (CityKey.SIMFEROPOL,      'Сімферополь',      0.40, 0.50),
+)
+
+_CITIES: Mapping[CityKey, City] = MappingProxyType({
+    key: City(name, soil_freezing_depth__Z_H_max, climate_index__a_0)
+    for key, name, soil_freezing_depth__Z_H_max, climate_index__a_0 in _CITY_ROWS
+})
+
+# Назви міст (українською та латиницею) у нижньому регістрі
+_NAME_TO_KEY: Mapping[str, CityKey] = MappingProxyType({
+    **{city.name.lower(): key for key, city in _CITIES.items()},
+    **{key.name.lower().replace('_', '-'): key for key in CityKey},
+})
+
+
+def get_city_key(city_name: Union[str, CityKey]) -> CityKey:
+    """Повертає ключ CityKey за назвою міста (українською або латиницею) чи самим ключем."""
+    if city_name.__class__ is CityKey:
+        return city_name
+    city_key = _NAME_TO_KEY.get(city_name.lower())
+    if city_key is None:
+        raise KeyError(f"Місто {city_name} не знайдено в базі даних")
+    return city_key
+
+
+def get_city(city_name: Union[str, CityKey]) -> City:
+    """Повертає об'єкт міста за його назвою (українською або латиницею) чи ключем CityKey."""
+    return _CITIES[get_city_key(city_name)]
 
 
 class CityTable:
@@ -26,40 +133,11 @@ class CityTable:
     """
 
     def __init__(self):
-        self._cities: Dict[str, City] = {
-            'київ':             City('Київ', soil_freezing_depth__Z_H_max=0.95, climate_index__a_0=0.65),
-            'харків':           City('Харків', soil_freezing_depth__Z_H_max=1.00, climate_index__a_0=0.95),
-            'львів':            City('Львів', soil_freezing_depth__Z_H_max=0.85, climate_index__a_0=0.70),
-            'одеса':            City('Одеса', soil_freezing_depth__Z_H_max=0.65, climate_index__a_0=0.70),
-            'дніпро':           City('Дніпро', soil_freezing_depth__Z_H_max=0.85, climate_index__a_0=0.85),
-            'донецьк':          City('Донецьк', soil_freezing_depth__Z_H_max=0.90, climate_index__a_0=0.90),
-            'луцьк':            City('Луцьк', soil_freezing_depth__Z_H_max=0.80, climate_index__a_0=0.60),
-            'ужгород':          City('Ужгород', soil_freezing_depth__Z_H_max=0.65, climate_index__a_0=0.55),
-            'чернігів':         City('Чернігів', soil_freezing_depth__Z_H_max=1.10, climate_index__a_0=0.90),
-            'суми':             City('Суми', soil_freezing_depth__Z_H_max=1.05, climate_index__a_0=1.00),
-            'полтава':          City('Полтава', soil_freezing_depth__Z_H_max=0.95, climate_index__a_0=0.90),
-            'черкаси':          City('Черкаси', soil_freezing_depth__Z_H_max=0.90, climate_index__a_0=0.80),
-            'вінниця':          City('Вінниця', soil_freezing_depth__Z_H_max=0.85, climate_index__a_0=0.50),
-            'житомир':          City('Житомир', soil_freezing_depth__Z_H_max=0.90, climate_index__a_0=0.55),
-            'хмельницький':     City('Хмельницький', soil_freezing_depth__Z_H_max=0.85, climate_index__a_0=0.50),
-            'тернопіль':        City('Тернопіль', soil_freezing_depth__Z_H_max=0.85, climate_index__a_0=0.55),
-            'рівне':            City('Рівне', soil_freezing_depth__Z_H_max=0.85, climate_index__a_0=0.60),
-            'івано-франківськ': City('Івано-Франківськ', soil_freezing_depth__Z_H_max=0.90, climate_index__a_0=0.70),
-            'чернівці':         City('Чернівці', soil_freezing_depth__Z_H_max=0.75, climate_index__a_0=0.60),
-            'миколаїв':         City('Миколаїв', soil_freezing_depth__Z_H_max=0.70, climate_index__a_0=0.75),
-            'херсон':           City('Херсон', soil_freezing_depth__Z_H_max=0.70, climate_index__a_0=0.70),
-            'запоріжжя':        City('Запоріжжя', soil_freezing_depth__Z_H_max=0.80, climate_index__a_0=0.85),
-            'кропивницький':    City('Кропивницький', soil_freezing_depth__Z_H_max=0.85, climate_index__a_0=0.85),
-            'луганськ':         City('Луганськ', soil_freezing_depth__Z_H_max=1.00, climate_index__a_0=0.95),
-            'сімферополь':      City('Сімферополь', soil_freezing_depth__Z_H_max=0.40, climate_index__a_0=0.50)
-        }
-
-    def get_city(self, city_name: str) -> City:
-        """Повертає об'єкт міста за його назвою."""
-        city_key = city_name.lower()
-        if city_key not in self._cities:
-            raise KeyError(f"Місто {city_name} не знайдено в базі даних")
-        return self._cities[city_key]
+        self._cities: Mapping[CityKey, City] = _CITIES
+
+    def get_city(self, city_name: Union[str, CityKey]) -> City:
+        """Повертає об'єкт міста за його назвою (українською або латиницею) чи ключем CityKey."""
+        return get_city(city_name)
 
     def list_cities(self) -> list[str]:
         """Повертає список всіх доступних міст."""
@@ -1,7 +1,9 @@
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Union
 
-from city import CityTable, City
+from city import City, CityKey, get_city, get_city_key
 
 
 class ClimateZone(Enum):
@@ -15,6 +17,15 @@ class ClimateZone(Enum):
     ZONE_4 = "IV"   # IV зона (розділяється на західну та південну частини)
 
 
+class ClimateSubzone(Enum):
+    """
+    Частини IV дорожньо-кліматичної зони.
+
+    """
+    WEST = "west"    # західна частина
+    SOUTH = "south"  # південна частина
+
+
 class TerrainType(Enum):
     """
     Типи місцевості за характером зволоження.
@@ -25,6 +36,54 @@ class TerrainType(Enum):
     TYPE_3 = 3  # Підвищена вологість, погане водовідведення
 
 
+# Кількість розрахункових діб на рік за (зоною, частиною IV зони)
+_DAYS_TABLE = MappingProxyType({
+    (ClimateZone.ZONE_1, None): 145,
+    (ClimateZone.ZONE_2, None): 135,
+    (ClimateZone.ZONE_3, None): 130,
+    (ClimateZone.ZONE_4, ClimateSubzone.WEST): 140,
+    (ClimateZone.ZONE_4, ClimateSubzone.SOUTH): 120,
+})
+
+# Розрахункова температура матеріалів на основі органічних в'яжучих за (зоною, частиною IV зони)
+_TEMP_TABLE = MappingProxyType({
+    (ClimateZone.ZONE_1, None): 20,
+    (ClimateZone.ZONE_2, None): 25,
+    (ClimateZone.ZONE_3, None): 30,
+    (ClimateZone.ZONE_4, ClimateSubzone.WEST): 25,
+    (ClimateZone.ZONE_4, ClimateSubzone.SOUTH): 35,
+})
+
+
+def calculate_climate_index(
+        frost_depth: float,
+        road_thickness: float,
+        freezing_duration: int
+) -> float:
+    """
+    Розраховує кліматичний показник α0 за формулою α0 = (Z - Z0)^2 / (2Тз).
+
+    Args:
+        frost_depth (float): Середня багаторічна глибина промерзання ґрунту (Z)
+        road_thickness (float): Товщина дорожнього одягу (Z0)
+        freezing_duration (int): Середня тривалість промерзання ґрунту (Тз)
+
+    Returns:
+        float: Розрахований кліматичний показник α0
+    """
+    depth_difference = frost_depth - road_thickness
+    return depth_difference * depth_difference / (2 * freezing_duration)
+
+
+def _to_float_or_none(name: str, value: Optional[float]) -> Optional[float]:
+    """Перевіряє, що числовий параметр є int/float (або None), і зводить його до float."""
+    if value is None:
+        return None
+    if value.__class__ is bool or not isinstance(value, (int, float)):
+        raise ValueError(f'{name} must be a number')
+    return float(value)
+
+
 class ClimateConfig:
     """
     Конфігурація кліматичних параметрів для розрахунку нежорсткого дорожнього одягу.
@@ -32,10 +91,13 @@ class ClimateConfig:
     Args:
         zone (ClimateZone): Дорожньо-кліматична зона
         terrain_type (TerrainType): Тип місцевості за характером зволоження
-        city (str, optional): Назва міста українською, альтернатива для soil_freezing_depth__Z_H_max
+        city (str | CityKey, optional): Назва міста (українською або латиницею) чи CityKey, альтернатива для soil_freezing_depth__Z_H_max
+            та climate_index__a_0 (обов'язкова, якщо хоча б один з них не заданий)
         soil_freezing_depth__Z_H_max (float, optional): Глибина промерзання ґрунту в метрах (якщо відома)
         climate_index__a_0 (float, optional): Кліматичний показник α0 (якщо відомий)
         is_sandy_soil (bool, optional): True якщо ґрунт - супісок, дрібний або пилуватий пісок
+        subzone (ClimateSubzone, optional): Частина IV зони; потрібна для calculation_days та
+            design_temperature у ClimateZone.ZONE_4, для інших зон ігнорується
 
 
     Example:
@@ -60,28 +122,132 @@ class ClimateConfig:
         коефіцієнта на території України"
     """
 
+    __slots__ = (
+        'zone',
+        'terrain_type',
+        'subzone',
+        'city_data',
+        'soil_freezing_depth__Z_H_max',
+        'climate_index__a_0',
+        'is_sandy_soil',
+        '_calc_days',
+        '_design_temp',
+    )
+    _FROZEN_ATTRS = frozenset(__slots__)
+
     def __init__(
             self,
             zone: ClimateZone,
             terrain_type: TerrainType,
-            city: Optional[str] = None,
+            city: Optional[Union[str, CityKey]] = None,
             soil_freezing_depth__Z_H_max: Optional[float] = None,
             climate_index__a_0: Optional[float] = None,
             is_sandy_soil: Optional[bool] = False,
+            subzone: Optional[ClimateSubzone] = None,
         ):
-        if not isinstance(zone, ClimateZone):
+        if zone.__class__ is not ClimateZone:
             raise ValueError('zone must be ClimateZone enum')
-        if not isinstance(terrain_type, TerrainType):
+        if terrain_type.__class__ is not TerrainType:
             raise ValueError('terrain_type must be TerrainType enum')
+        if subzone is not None and subzone.__class__ is not ClimateSubzone:
+            raise ValueError('subzone must be ClimateSubzone enum')
+        soil_freezing_depth__Z_H_max = _to_float_or_none('soil_freezing_depth__Z_H_max', soil_freezing_depth__Z_H_max)
+        climate_index__a_0 = _to_float_or_none('climate_index__a_0', climate_index__a_0)
+
+        _set = object.__setattr__
+        _set(self, 'zone', zone)
+        _set(self, 'terrain_type', terrain_type)
+        # Частина зони впливає лише на IV зону; для IV зони без неї значення невизначені (None)
+        if zone is not ClimateZone.ZONE_4:
+            subzone = None
+        _set(self, 'subzone', subzone)
+        zone_key = (zone, subzone)
+        _set(self, '_calc_days', _DAYS_TABLE.get(zone_key))
+        _set(self, '_design_temp', _TEMP_TABLE.get(zone_key))
+
+        city_data = None
+        if soil_freezing_depth__Z_H_max is None or climate_index__a_0 is None:
+            if city is None:
+                raise ValueError('city is required when soil_freezing_depth__Z_H_max or climate_index__a_0 is not set')
+            city_data = get_city(city)
+        _set(self, 'city_data', city_data)
+        _set(self, 'soil_freezing_depth__Z_H_max', (
+            soil_freezing_depth__Z_H_max
+            if soil_freezing_depth__Z_H_max is not None
+            else self._get_soil_freezing_depth_by_city(city_data, is_sandy_soil)
+        ))
+        _set(self, 'climate_index__a_0', (
+            climate_index__a_0
+            if climate_index__a_0 is not None
+            else self._get_climate_index_by_city(city_data)
+        ))
+        _set(self, 'is_sandy_soil', bool(is_sandy_soil))
+
+    def __setattr__(self, name, value):
+        # Екземпляри з get_cached спільні, тому власні атрибути задаються лише в __init__;
+        # атрибути, оголошені підкласами, залишаються доступними для запису
+        if name in ClimateConfig._FROZEN_ATTRS:
+            raise AttributeError(f'ClimateConfig is immutable, cannot set {name!r}')
+        object.__setattr__(self, name, value)
 
-        self.zone = zone
-        self.terrain_type = terrain_type
+    def __delattr__(self, name):
+        if name in ClimateConfig._FROZEN_ATTRS:
+            raise AttributeError(f'ClimateConfig is immutable, cannot delete {name!r}')
+        object.__delattr__(self, name)
 
-        self.city_table = CityTable()
-        self.city_data = self.city_table.get_city(city)
-        self.soil_freezing_depth__Z_H_max = soil_freezing_depth__Z_H_max or self._get_soil_freezing_depth_by_city(self.city_data, is_sandy_soil)
-        self.climate_index__a_0 = climate_index__a_0 or self._get_climate_index_by_city(self.city_data)
-        self.is_sandy_soil = is_sandy_soil
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            for name in (slots,) if slots.__class__ is str else slots:
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def get_cached(
+            cls,
+            zone: ClimateZone,
+            terrain_type: TerrainType,
+            city: Optional[Union[str, CityKey]] = None,
+            soil_freezing_depth__Z_H_max: Optional[float] = None,
+            climate_index__a_0: Optional[float] = None,
+            is_sandy_soil: Optional[bool] = False,
+            subzone: Optional[ClimateSubzone] = None,
+    ) -> 'ClimateConfig':
+        """
+        Повертає спільний (кешований) екземпляр конфігурації для заданих параметрів.
+
+        Аргументи ті самі, що й у конструктора. Місто зводиться до CityKey, а числові
+        значення - до float, тому 'Київ', 'kyiv' та CityKey.KYIV дають той самий екземпляр.
+        Екземпляри незмінні, тому copy/deepcopy повертають той самий об'єкт.
+
+        Returns:
+            ClimateConfig: Незмінна конфігурація кліматичних параметрів
+        """
+        soil_freezing_depth__Z_H_max = _to_float_or_none('soil_freezing_depth__Z_H_max', soil_freezing_depth__Z_H_max)
+        climate_index__a_0 = _to_float_or_none('climate_index__a_0', climate_index__a_0)
+        if zone is not ClimateZone.ZONE_4:
+            subzone = None
+        if soil_freezing_depth__Z_H_max is not None and climate_index__a_0 is not None:
+            # Місто не використовується, якщо обидва значення задані
+            city = None
+        elif city is not None:
+            city = get_city_key(city)
+        return _get_cached_config(
+            cls, zone, terrain_type, city,
+            soil_freezing_depth__Z_H_max, climate_index__a_0, bool(is_sandy_soil), subzone,
+        )
 
     def _get_soil_freezing_depth_by_city(self, city: City, is_sandy_soil: bool) -> float:
         """
@@ -97,8 +263,9 @@ class ClimateConfig:
             Для супісків, дрібних та пилуватих пісків значення
             збільшується на 20%.
         """
-        base_depth = city.soil_freezing_depth__Z_H_max
-        return base_depth * 1.2 if is_sandy_soil else base_depth
+        if is_sandy_soil:
+            return city.soil_freezing_depth_sandy__Z_H_max
+        return city.soil_freezing_depth__Z_H_max
 
     def _get_climate_index_by_city(self, city: City) -> float:
         """
@@ -129,15 +296,9 @@ class ClimateConfig:
         """
         Розраховує кліматичний показник α0 за формулою.
 
-        Args:
-            frost_depth (float): Середня багаторічна глибина промерзання ґрунту (Z)
-            road_thickness (float): Товщина дорожнього одягу (Z0)
-            freezing_duration (int): Середня тривалість промерзання ґрунту (Тз)
-
-        Returns:
-            float: Розрахований кліматичний показник α0
+        Див. calculate_climate_index на рівні модуля.
         """
-        return (frost_depth - road_thickness) ** 2 / (2 * freezing_duration)
+        return calculate_climate_index(frost_depth, road_thickness, freezing_duration)
 
     @property
     def calculation_days(self) -> int:
@@ -147,13 +308,9 @@ class ClimateConfig:
         Returns:
             int: Кількість розрахункових діб
         """
-        days_map = {
-            ClimateZone.ZONE_1: 145,
-            ClimateZone.ZONE_2: 135,
-            ClimateZone.ZONE_3: 130,
-            ClimateZone.ZONE_4: {"west": 140, "south": 120}
-        }
-        return days_map[self.zone]
+        if self._calc_days is None:
+            raise ValueError('subzone is required to get calculation_days for ClimateZone.ZONE_4')
+        return self._calc_days
 
     @property
     def design_temperature(self) -> int:
@@ -163,10 +320,28 @@ class ClimateConfig:
         Returns:
             int: Розрахункова температура в градусах Цельсія
         """
-        temp_map = {
-            ClimateZone.ZONE_1: 20,
-            ClimateZone.ZONE_2: 25,
-            ClimateZone.ZONE_3: 30,
-            ClimateZone.ZONE_4: {"west": 25, "south": 35}
-        }
-        return temp_map[self.zone]
\ No newline at end of file
+        if self._design_temp is None:
+            raise ValueError('subzone is required to get design_temperature for ClimateZone.ZONE_4')
+        return self._design_temp
+
+
+@lru_cache(maxsize=128)
+def _get_cached_config(
+        cls: type,
+        zone: ClimateZone,
+        terrain_type: TerrainType,
+        city: Optional[Union[str, CityKey]],
+        soil_freezing_depth__Z_H_max: Optional[float],
+        climate_index__a_0: Optional[float],
+        is_sandy_soil: bool,
+        subzone: Optional[ClimateSubzone],
+) -> ClimateConfig:
+    return cls(
+        zone=zone,
+        terrain_type=terrain_type,
+        city=city,
+        soil_freezing_depth__Z_H_max=soil_freezing_depth__Z_H_max,
+        climate_index__a_0=climate_index__a_0,
+        is_sandy_soil=is_sandy_soil,
+        subzone=subzone,
+    )